@@ -2,9 +2,17 @@
 Economic Indicator Forecasting Module
 Implements ARIMA and Prophet models for time series forecasting
 """
+import os
+import glob
+import hashlib
+import importlib.util
+import pickle
+import tempfile
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,24 +24,171 @@ except ImportError:
     ARIMA_AVAILABLE = False
     print("statsmodels not installed. ARIMA forecasting unavailable.")
 
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except ImportError:
-    PROPHET_AVAILABLE = False
+# Prophet (and its Stan backend) is slow to import, so only check that it is
+# installed here and import it on first use in fit_prophet. This keeps it off
+# the startup path of ARIMA-only callers and auto_arima worker processes.
+PROPHET_AVAILABLE = importlib.util.find_spec('prophet') is not None
+if not PROPHET_AVAILABLE:
     print("prophet not installed. Prophet forecasting unavailable.")
 
 
+# Upper bounds on the median spacing between observations, and the frequency
+# alias used when pandas cannot infer one: daily, weekly, month start,
+# quarter start, otherwise year start
+_FREQ_BOUNDS_NS = np.array([1, 7, 31, 92]) * 86_400 * 10**9
+_FREQ_ALIASES = ('D', 'W', 'MS', 'QS', 'YS')
+
+
+def _freq_from_ns(median_ns):
+    """Map a median observation spacing in nanoseconds to a frequency alias"""
+    return _FREQ_ALIASES[np.searchsorted(_FREQ_BOUNDS_NS, median_ns)]
+
+
+def _fit_arima_order(diffed, order, method='statespace'):
+    """
+    Fit a single ARIMA order for the grid search (top-level so it can be
+    pickled into worker processes)
+
+    The candidate is fitted as ARMA(p, q) on the series already differenced
+    d times, so the differencing is done once per search instead of once
+    per candidate.
+
+    Args:
+        diffed: Series differenced d times
+        order: ARIMA order (p, d, q)
+        method: statsmodels ARIMA estimation method
+
+    Returns:
+        (order, aic) tuple, or None if the fit failed
+    """
+    p, d, q = order
+    # ARIMA drops the constant for integrated models; mirror that here
+    trend = 'n' if d > 0 else None
+    try:
+        return order, ARIMA(diffed, order=(p, 0, q), trend=trend).fit(method=method).aic
+    except Exception:
+        return None
+
+
+def _fit_orders(series, orders, n_jobs, executor=None, method='statespace'):
+    """
+    Fit every candidate order, spreading the fits across processes
+
+    Args:
+        series: Time series to fit, already differenced d times
+        orders: List of (p, d, q) tuples
+        n_jobs: Number of worker processes (1 fits in-process)
+        executor: Optional ProcessPoolExecutor to reuse across calls
+        method: statsmodels ARIMA estimation method
+
+    Returns:
+        List of (order, aic) tuples for the fits that succeeded
+    """
+    if n_jobs <= 1 or len(orders) <= 1:
+        results = [_fit_arima_order(series, order, method) for order in orders]
+    else:
+        chunksize = max(1, len(orders) // (4 * n_jobs))
+        fit = partial(_fit_arima_order, series, method=method)
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(fit, orders, chunksize=chunksize))
+        else:
+            results = list(executor.map(fit, orders, chunksize=chunksize))
+
+    return [result for result in results if result is not None]
+
+
+def _stepwise_search(series, d, max_p, max_q, n_jobs, executor=None, method='statespace'):
+    """
+    Hyndman-Khandakar stepwise search over (p, q) at a fixed d
+
+    Starts from (2, d, 2) plus the simple (0, 0), (1, 0) and (0, 1) models,
+    then repeatedly fits the unvisited neighbours (p +/- 1, q +/- 1) of the
+    current best order, stopping once no neighbour improves the AIC.
+
+    Returns:
+        List of (order, aic) tuples for the fits that succeeded
+    """
+    start = {(min(2, max_p), d, min(2, max_q)), (0, d, 0),
+             (min(1, max_p), d, 0), (0, d, min(1, max_q))}
+    tried = set(start)
+    results = dict(_fit_orders(series, sorted(start), n_jobs, executor, method))
+    if not results:
+        return []
+
+    best = min(results, key=results.get)
+    while True:
+        p, _, q = best
+        neighbors = [(p + dp, d, q + dq)
+                     for dp in (-1, 0, 1)
+                     for dq in (-1, 0, 1)
+                     if 0 <= p + dp <= max_p and 0 <= q + dq <= max_q]
+        neighbors = [order for order in neighbors if order not in tried]
+        if not neighbors:
+            break
+
+        tried.update(neighbors)
+        results.update(_fit_orders(series, neighbors, n_jobs, executor, method))
+
+        new_best = min(results, key=results.get)
+        if new_best == best:
+            break
+        best = new_best
+
+    return list(results.items())
+
+
+def _error_metrics(actual, forecast):
+    """
+    Compute MAE, RMSE and MAPE from a single set of forecast errors
+
+    Args:
+        actual: Actual values
+        forecast: Forecasted values
+
+    Returns:
+        (mae, rmse, mape) tuple
+    """
+    actual = np.asarray(actual, dtype=np.float64)
+    forecast = np.asarray(forecast, dtype=np.float64)
+
+    errors = actual - forecast
+    abs_errors = np.abs(errors)
+
+    mae = abs_errors.mean()
+    rmse = np.sqrt(np.dot(errors, errors) / len(errors))
+
+    # Skip zero actuals to avoid division by zero, without building masked copies
+    nonzero = actual != 0
+    ratios = np.divide(abs_errors, np.abs(actual), out=np.zeros_like(abs_errors), where=nonzero)
+    count = np.count_nonzero(nonzero)
+    mape = ratios.sum() / count * 100 if count else np.nan
+
+    return mae, rmse, mape
+
+
 class EconomicForecaster:
     """Forecast economic indicators using statistical models"""
 
-    def __init__(self):
-        """Initialize forecaster"""
+    def __init__(self, cache_dir=None):
+        """
+        Initialize forecaster
+
+        Args:
+            cache_dir: Optional directory for pickled ARIMA fits; fit_arima
+                reuses a cached fit when the data and order are unchanged
+        """
         self.model = None
         self.model_type = None
         self.fitted = False
         self.last_date = None
         self.freq = None
+        # Estimation method of the current ARIMA fit, reused by backtest
+        self.arima_method = None
+        self.cache_dir = cache_dir
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
 
     def check_stationarity(self, timeseries, significance_level=0.05):
         """
@@ -61,7 +216,63 @@ class EconomicForecaster:
             'critical_values': result[4]
         }
 
-    def fit_arima(self, df, order=(1, 1, 1), seasonal_order=None):
+    def _prepare_series(self, df, freq=None):
+        """
+        Build the value series and record its last date and frequency
+
+        Args:
+            df: DataFrame with 'observation_date' and 'value' columns
+            freq: Known frequency alias; skips frequency inference when given
+
+        Returns:
+            Pandas Series of values indexed by observation date
+        """
+        df = df.sort_values('observation_date')
+        series = pd.Series(df['value'].to_numpy(),
+                           index=pd.DatetimeIndex(df['observation_date']),
+                           name='value').dropna()
+
+        # Store the last date and infer frequency for forecasting
+        self.last_date = series.index[-1]
+        self.freq = freq or pd.infer_freq(series.index)
+
+        # If frequency can't be inferred, fall back to the median spacing
+        if self.freq is None:
+            self.freq = _freq_from_ns(np.median(np.diff(series.index.as_unit('ns').asi8)))
+        self.freq = self.freq or 'D'
+
+        return series
+
+    def _select_differencing(self, series, max_d, significance_level=0.05):
+        """
+        Choose the differencing order d with repeated ADF tests
+
+        Args:
+            series: Pandas Series with time series data
+            max_d: Maximum differencing order
+            significance_level: Significance level for the ADF test
+
+        Returns:
+            (d, diffed) with the smallest d (up to max_d) whose differenced
+            series is stationary, and that differenced series. If the ADF
+            test cannot run (too few points, or a constant series), d stops
+            increasing there.
+        """
+        d = 0
+        diffed = series
+        while d < max_d:
+            try:
+                if self.check_stationarity(diffed, significance_level)['is_stationary']:
+                    break
+            except (ValueError, np.linalg.LinAlgError):
+                break
+            diffed = diffed.diff().dropna()
+            d += 1
+
+        return d, diffed
+
+    def fit_arima(self, df, order=(1, 1, 1), seasonal_order=None, method='statespace',
+                  series_id=None):
         """
         Fit ARIMA model to time series data
 
@@ -69,6 +280,10 @@ class EconomicForecaster:
             df: DataFrame with 'observation_date' and 'value' columns
             order: ARIMA order (p, d, q)
             seasonal_order: Seasonal ARIMA order (P, D, Q, s) or None
+            method: Estimation method for non-seasonal models; 'innovations_mle'
+                is faster than the default Kalman filter on long (daily) series
+            series_id: Optional name of the series; with a cache_dir, older
+                cached fits of the same series are removed when it is refitted
 
         Returns:
             Fitted model
@@ -76,45 +291,124 @@ class EconomicForecaster:
         if not ARIMA_AVAILABLE:
             raise ImportError("statsmodels not installed. Install with: pip install statsmodels")
 
-        # Prepare data
-        df = df.sort_values('observation_date')
-        df = df.set_index('observation_date')
-        series = df['value'].dropna()
+        series = self._prepare_series(df)
+        self.arima_method = method
 
-        # Store the last date and infer frequency for forecasting
-        self.last_date = series.index[-1]
-        self.freq = pd.infer_freq(series.index)
+        cache_path = self._model_cache_path(series, order, seasonal_order, method, series_id)
+        if cache_path and self._load_cached_model(cache_path):
+            print(f"ARIMA{order} model loaded from cache")
+            return self.model
 
-        # If frequency can't be inferred, try to determine from data
-        if self.freq is None:
-            date_diffs = series.index.to_series().diff().dropna()
-            median_diff = date_diffs.median()
-
-            if median_diff <= pd.Timedelta(days=1):
-                self.freq = 'D'  # Daily
-            elif median_diff <= pd.Timedelta(days=7):
-                self.freq = 'W'  # Weekly
-            elif median_diff <= pd.Timedelta(days=31):
-                self.freq = 'MS'  # Month start
-            elif median_diff <= pd.Timedelta(days=92):
-                self.freq = 'QS'  # Quarter start
-            else:
-                self.freq = 'YS'  # Year start
+        self._fit_arima_series(series, order, seasonal_order, method)
 
-        # Fit model
+        if cache_path:
+            self._save_cached_model(cache_path, prune=series_id is not None)
+
+        print(f"ARIMA{order} model fitted successfully")
+        return self.model
+
+    def _model_cache_path(self, series, order, seasonal_order, method, series_id=None):
+        """
+        Path of the cached fit for this exact series and model specification
+
+        With a series_id, the name starts with a key built from it and the
+        model specification, which stays the same as new data is appended,
+        so older fits of the same series can be found and removed.
+
+        Returns:
+            File path, or None when caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+
+        spec = repr((order, seasonal_order, method)).encode('utf-8')
+
+        key = hashlib.blake2b(digest_size=8)
+        key.update(series.index.as_unit('ns').asi8.tobytes())
+        key.update(series.to_numpy(dtype=np.float64).tobytes())
+        key.update(spec)
+
+        filename = f"arima_{self.last_date:%Y%m%d}_{key.hexdigest()}.pkl"
+        if series_id is not None:
+            series_key = hashlib.blake2b(str(series_id).encode('utf-8') + b'\0' + spec,
+                                         digest_size=4)
+            filename = f"arima_{series_key.hexdigest()}_{filename[len('arima_'):]}"
+        return os.path.join(self.cache_dir, filename)
+
+    def _load_cached_model(self, cache_path):
+        """
+        Load a cached fit into self.model
+
+        A file that cannot be unpickled (a truncated write, or one pickled
+        by another statsmodels version) is deleted so the model is refitted
+        and cached again.
+
+        Returns:
+            True if the cached model was loaded
+        """
+        if not os.path.exists(cache_path):
+            return False
+
+        try:
+            with open(cache_path, 'rb') as f:
+                model = pickle.load(f)
+        except Exception as e:
+            print(f"Discarding unreadable cached model {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return False
+
+        self.model = model
+        self.model_type = 'ARIMA'
+        self.fitted = True
+        return True
+
+    def _save_cached_model(self, cache_path, prune=False):
+        """
+        Atomically write self.model to cache_path and, with prune, remove
+        older fits of the same series and model specification
+
+        Failures are reported and otherwise ignored; the fit itself is kept.
+        """
+        cache_dir, filename = os.path.split(cache_path)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self.model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not cache model to {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        if not prune:
+            return
+
+        # Same series key prefix: arima_<series key>_
+        prefix = filename[:filename.index('_', len('arima_')) + 1]
+        for stale in glob.glob(os.path.join(cache_dir, glob.escape(prefix) + '*.pkl')):
+            if os.path.basename(stale) != filename:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def _fit_arima_series(self, series, order, seasonal_order=None, method='statespace'):
+        """Fit an ARIMA/SARIMAX model to an already prepared series"""
         if seasonal_order:
             from statsmodels.tsa.statespace.sarimax import SARIMAX
-            self.model = SARIMAX(series, order=order, seasonal_order=seasonal_order)
+            self.model = SARIMAX(series, order=order, seasonal_order=seasonal_order).fit()
         else:
-            self.model = ARIMA(series, order=order)
+            self.model = ARIMA(series, order=order).fit(method=method)
 
-        self.model = self.model.fit()
         self.model_type = 'ARIMA'
         self.fitted = True
 
-        print(f"ARIMA{order} model fitted successfully")
-        return self.model
-
     def fit_prophet(self, df, yearly_seasonality=True, weekly_seasonality=False):
         """
         Fit Prophet model to time series data
@@ -130,6 +424,8 @@ class EconomicForecaster:
         if not PROPHET_AVAILABLE:
             raise ImportError("prophet not installed. Install with: pip install prophet")
 
+        from prophet import Prophet
+
         # Prepare data for Prophet (needs 'ds' and 'y' columns)
         prophet_df = df[['observation_date', 'value']].copy()
         prophet_df.columns = ['ds', 'y']
@@ -162,36 +458,16 @@ class EconomicForecaster:
         if not self.fitted or self.model_type != 'ARIMA':
             raise ValueError("ARIMA model not fitted. Call fit_arima() first.")
 
-        # Generate forecast
-        forecast_result = self.model.forecast(steps=steps, alpha=alpha)
-
-        # Get confidence intervals
-        forecast_df = self.model.get_forecast(steps=steps, alpha=alpha).summary_frame()
-
-        # Create forecast dates using stored last_date and freq
-        last_date = self.last_date
-        freq = self.freq
-
-        # Calculate the appropriate start date based on frequency
-        if freq == 'D':
-            start_date = last_date + timedelta(days=1)
-        elif freq in ['W', 'W-SUN']:
-            start_date = last_date + timedelta(days=7)
-        elif freq in ['MS', 'M']:
-            start_date = last_date + pd.DateOffset(months=1)
-        elif freq in ['QS', 'Q']:
-            start_date = last_date + pd.DateOffset(months=3)
-        elif freq in ['YS', 'Y']:
-            start_date = last_date + pd.DateOffset(years=1)
-        else:
-            # Default to next day if unknown
-            start_date = last_date + timedelta(days=1)
+        # Get forecast with confidence intervals
+        forecast_df = self.model.get_forecast(steps=steps).summary_frame(alpha=alpha)
 
+        # Create forecast dates using stored last_date and freq; the range
+        # starts at last_date itself, so drop that first element
         forecast_dates = pd.date_range(
-            start=start_date,
-            periods=steps,
-            freq=freq
-        )
+            start=self.last_date,
+            periods=steps + 1,
+            freq=self.freq
+        )[1:]
 
         result = pd.DataFrame({
             'date': forecast_dates,
@@ -235,15 +511,24 @@ class EconomicForecaster:
 
         return result
 
-    def auto_arima(self, df, max_p=5, max_d=2, max_q=5):
+    def auto_arima(self, df, max_p=5, max_d=2, max_q=5, n_jobs=None, stepwise=False,
+                   method='statespace'):
         """
         Automatically select best ARIMA order using AIC
 
+        The differencing order d is chosen once with ADF tests, then only
+        (p, q) is searched. Candidate orders are fitted in parallel worker
+        processes. On Windows, call this from under an
+        ``if __name__ == "__main__":`` guard.
+
         Args:
             df: DataFrame with 'observation_date' and 'value' columns
             max_p: Maximum p value to test
             max_d: Maximum d value to test
             max_q: Maximum q value to test
+            n_jobs: Number of worker processes (default: CPU count - 1)
+            stepwise: Use a stepwise neighbourhood search instead of the full (p, q) grid
+            method: Estimation method for every fit (see fit_arima)
 
         Returns:
             Best order and fitted model
@@ -251,57 +536,46 @@ class EconomicForecaster:
         if not ARIMA_AVAILABLE:
             raise ImportError("statsmodels not installed")
 
-        # Prepare data
-        df = df.sort_values('observation_date')
-        df = df.set_index('observation_date')
-        series = df['value'].dropna()
+        series = self._prepare_series(df)
 
-        # Store the last date and infer frequency for forecasting
-        self.last_date = series.index[-1]
-        self.freq = pd.infer_freq(series.index)
+        if n_jobs is None:
+            n_jobs = max(1, (os.cpu_count() or 1) - 1)
 
-        # If frequency can't be inferred, try to determine from data
-        if self.freq is None:
-            date_diffs = series.index.to_series().diff().dropna()
-            median_diff = date_diffs.median()
-
-            if median_diff <= pd.Timedelta(days=1):
-                self.freq = 'D'  # Daily
-            elif median_diff <= pd.Timedelta(days=7):
-                self.freq = 'W'  # Weekly
-            elif median_diff <= pd.Timedelta(days=31):
-                self.freq = 'MS'  # Month start
-            elif median_diff <= pd.Timedelta(days=92):
-                self.freq = 'QS'  # Quarter start
+        d, diffed = self._select_differencing(series, max_d)
+
+        print(f"Searching for best ARIMA order (d={d})...")
+
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        try:
+            if stepwise:
+                results = _stepwise_search(diffed, d, max_p, max_q, n_jobs, executor, method)
             else:
-                self.freq = 'YS'  # Year start
+                orders = [(p, d, q) for p in range(max_p + 1) for q in range(max_q + 1)]
+                results = _fit_orders(diffed, orders, n_jobs, executor, method)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         best_aic = np.inf
         best_order = None
         best_model = None
 
-        print("Searching for best ARIMA order...")
-
-        for p in range(max_p + 1):
-            for d in range(max_d + 1):
-                for q in range(max_q + 1):
-                    try:
-                        model = ARIMA(series, order=(p, d, q))
-                        fitted_model = model.fit()
-                        aic = fitted_model.aic
-
-                        if aic < best_aic:
-                            best_aic = aic
-                            best_order = (p, d, q)
-                            best_model = fitted_model
-
-                    except:
-                        continue
+        # Refit the winner on the undifferenced series; if that fit fails,
+        # fall back to the next best order as the search would have skipped it
+        for order, _ in sorted(results, key=lambda result: result[1]):
+            try:
+                best_model = ARIMA(series, order=order).fit(method=method)
+            except Exception:
+                continue
+            best_order = order
+            best_aic = best_model.aic
+            break
 
         print(f"Best ARIMA order: {best_order} (AIC: {best_aic:.2f})")
 
         self.model = best_model
         self.model_type = 'ARIMA'
+        self.arima_method = method
         self.fitted = True
 
         return best_order, best_model
@@ -317,23 +591,22 @@ class EconomicForecaster:
         Returns:
             MAPE percentage
         """
-        actual = np.array(actual)
-        forecast = np.array(forecast)
-
-        # Remove zero values to avoid division by zero
-        mask = actual != 0
-        mape = np.mean(np.abs((actual[mask] - forecast[mask]) / actual[mask])) * 100
+        return _error_metrics(actual, forecast)[2]
 
-        return mape
-
-    def backtest(self, df, train_size=0.8, steps=12):
+    def backtest(self, df, train_size=0.8, steps=12, refit=True):
         """
         Perform simple backtesting
 
+        ARIMA models are backtested with the order of the fitted model (e.g.
+        the one chosen by auto_arima) and the frequency already inferred.
+
         Args:
             df: DataFrame with 'observation_date' and 'value' columns
             train_size: Proportion of data for training
             steps: Number of steps to forecast
+            refit: Re-estimate ARIMA parameters on the training data. If False,
+                the fitted parameters are reused on the training data (much
+                cheaper, but they have seen the test period)
 
         Returns:
             Dictionary with metrics
@@ -348,7 +621,15 @@ class EconomicForecaster:
 
         # Refit model on train data
         if self.model_type == 'ARIMA':
-            self.fit_arima(train_df)
+            fitted_model = self.model.model
+            series = self._prepare_series(train_df, freq=self.freq)
+            if refit:
+                seasonal_order = fitted_model.seasonal_order
+                self._fit_arima_series(series, fitted_model.order,
+                                       seasonal_order if any(seasonal_order) else None,
+                                       self.arima_method or 'statespace')
+            else:
+                self.model = self.model.apply(series)
             forecast_df = self.forecast_arima(steps=steps)
         elif self.model_type == 'Prophet':
             self.fit_prophet(train_df)
@@ -358,9 +639,7 @@ class EconomicForecaster:
         actual = test_df['value'].values
         forecast = forecast_df['forecast'].values[:len(actual)]
 
-        mape = self.calculate_mape(actual, forecast)
-        mae = np.mean(np.abs(actual - forecast))
-        rmse = np.sqrt(np.mean((actual - forecast)**2))
+        mae, rmse, mape = _error_metrics(actual, forecast)
 
         return {
             'mape': mape,
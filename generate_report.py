@@ -2,8 +2,10 @@
 Generate Economic Indicators Report
 Creates visualizations and forecasts for all indicators
 """
+import io
 import psycopg2
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -38,6 +40,39 @@ INDICATORS = {
 }
 
 
+# Column types of indicator history, declared so read_csv skips inference
+INDICATOR_DTYPES = {'series_id': str, 'value': np.float64}
+
+
+def _copy_to_dataframe(conn, query, params, dtype=None, parse_dates=None):
+    """
+    Run a query through COPY ... TO STDOUT and parse the CSV stream
+
+    COPY skips psycopg2's per-row tuple materialization, which is the slow
+    path of pd.read_sql for long numeric series.
+
+    Args:
+        conn: Database connection
+        query: SELECT statement with %s placeholders (no trailing semicolon)
+        params: Query parameters
+        dtype: Column dtypes, so read_csv does not have to infer them
+        parse_dates: DATE columns to parse (COPY writes them as YYYY-MM-DD)
+
+    Returns:
+        DataFrame with the query result
+    """
+    buffer = io.StringIO()
+    cursor = conn.cursor()
+    try:
+        select = cursor.mogrify(query, params).decode('utf-8')
+        cursor.copy_expert(f"COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer)
+    finally:
+        cursor.close()
+
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype=dtype, parse_dates=parse_dates, date_format='%Y-%m-%d')
+
+
 def fetch_indicator_data(conn, series_id):
     """
     Fetch indicator data from database
@@ -57,18 +92,54 @@ def fetch_indicator_data(conn, series_id):
         ORDER BY d.observation_date ASC
     """
 
-    df = pd.read_sql(query, conn, params=(series_id,))
-    df['observation_date'] = pd.to_datetime(df['observation_date'])
+    return _copy_to_dataframe(conn, query, (series_id,),
+                              dtype=INDICATOR_DTYPES, parse_dates=['observation_date'])
 
-    return df
+
+def fetch_all_indicator_data(conn, series_ids):
+    """
+    Fetch data for several indicators in a single query
+
+    Args:
+        conn: Database connection
+        series_ids: FRED series IDs
+
+    Returns:
+        Dictionary {series_id: df} with observation_date and value columns;
+        series without data are omitted
+    """
+    query = """
+        SELECT i.series_id, d.observation_date, d.value
+        FROM indicator_data d
+        JOIN indicators i ON d.indicator_id = i.indicator_id
+        WHERE i.series_id = ANY(%s)
+        ORDER BY i.series_id, d.observation_date ASC
+    """
+
+    df = _copy_to_dataframe(conn, query, (list(series_ids),),
+                            dtype=INDICATOR_DTYPES, parse_dates=['observation_date'])
+
+    return {
+        series_id: group.drop(columns='series_id').reset_index(drop=True)
+        for series_id, group in df.groupby('series_id', sort=False)
+    }
 
 
 def calculate_yoy_change(df):
     """Calculate year-over-year percentage change"""
-    df = df.copy()
-    df = df.sort_values('observation_date')
-    df['yoy_pct_change'] = df['value'].pct_change(periods=12) * 100
-    return df.dropna()
+    # sort_values already returns a new frame, so no extra copy is needed
+    df = df.sort_values('observation_date', kind='mergesort')
+
+    values = df['value'].to_numpy(dtype=np.float64)
+    yoy = np.empty_like(values)
+    yoy[:12] = np.nan
+    np.divide(values[12:], values[:-12], out=yoy[12:])
+    yoy[12:] -= 1
+    yoy[12:] *= 100
+
+    df['yoy_pct_change'] = yoy
+    # NaN covers the first 12 rows and any missing value now or a year earlier
+    return df[~np.isnan(yoy)]
 
 
 def generate_all_reports():
@@ -96,9 +167,10 @@ def generate_all_reports():
     # Fetch all data
     print("Fetching indicator data...")
     data_dict = {}
+    all_data = fetch_all_indicator_data(conn, INDICATORS)
     for series_id, name in INDICATORS.items():
-        df = fetch_indicator_data(conn, series_id)
-        if len(df) > 0:
+        df = all_data.get(series_id)
+        if df is not None and len(df) > 0:
             data_dict[name] = df
             print(f"  [OK] {name}: {len(df)} data points")
         else:
@@ -118,11 +190,10 @@ def generate_all_reports():
     print("Creating interactive dashboard...")
     charts.plot_interactive_dashboard(data_dict)
 
-    # 3. Individual time series plots
-    for name, df in data_dict.items():
-        if len(df) > 0:
-            print(f"Creating time series plot for {name}...")
-            charts.plot_time_series(df, name)
+    # 3. Individual time series plots (rendered in parallel for large batches)
+    print("Creating time series plots...")
+    charts.plot_batch(data_dict,
+                      on_saved=lambda name, _: print(f"  [OK] {name} time series plot"))
 
     # 4. Year-over-year change plots
     print()
@@ -138,14 +209,12 @@ def generate_all_reports():
     print()
     print("Calculating correlations...")
     if len(data_dict) > 1:
-        # Merge all data on common dates
-        correlation_df = None
-        for name, df in data_dict.items():
-            df_temp = df.set_index('observation_date')[['value']].rename(columns={'value': name})
-            if correlation_df is None:
-                correlation_df = df_temp
-            else:
-                correlation_df = correlation_df.join(df_temp, how='inner')
+        # Align all series on their common dates in a single concat
+        series_list = [
+            df.set_index('observation_date')['value'].rename(name)
+            for name, df in data_dict.items()
+        ]
+        correlation_df = pd.concat(series_list, axis=1, join='inner')
 
         if len(correlation_df) > 0:
             corr_matrix = correlation_df.corr()
@@ -158,7 +227,7 @@ def generate_all_reports():
     print("Generating Forecasts (ARIMA)")
     print("=" * 70)
 
-    forecaster = EconomicForecaster()
+    forecaster = EconomicForecaster(cache_dir='outputs/models')
 
     for name, df in data_dict.items():
         if len(df) >= 24:  # Need sufficient data for forecasting
@@ -166,7 +235,7 @@ def generate_all_reports():
             print(f"Forecasting {name}...")
             try:
                 # Fit ARIMA model
-                forecaster.fit_arima(df, order=(1, 1, 1))
+                forecaster.fit_arima(df, order=(1, 1, 1), series_id=name)
 
                 # Generate 12-month forecast
                 forecast_df = forecaster.forecast_arima(steps=12)
@@ -242,11 +311,12 @@ def generate_quick_summary():
 
         print("Latest Economic Indicators:")
         print("-" * 70)
-        for _, row in df.iterrows():
-            if pd.notna(row['value']):
-                print(f"{row['title']:40s} {row['value']:8.2f}  (as of {row['observation_date']})")
-            else:
-                print(f"{row['title']:40s} No data")
+        has_value = df['value'].notna()
+        details = (df['value'].map('{:8.2f}'.format, na_action='ignore')
+                   + '  (as of ' + df['observation_date'].astype(str) + ')')
+        lines = df['title'].str.ljust(40) + ' ' + details.where(has_value, 'No data')
+        if len(lines) > 0:
+            print('\n'.join(lines))
 
         conn.close()
 
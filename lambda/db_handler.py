@@ -1,15 +1,54 @@
 """
 Database Handler for PostgreSQL operations
 """
+import io
 import psycopg2
-from psycopg2.extras import execute_batch
-from typing import List, Dict, Tuple
+from contextlib import contextmanager
+from psycopg2.extras import execute_values
+from typing import List, Dict
 import logging
 from datetime import datetime
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Observation count from which upserts go through COPY into a staging table
+BULK_LOAD_THRESHOLD = 1024
+
+# Statements prepared once per connection and run with EXECUTE, so the
+# server parses and plans them only once
+PREPARED_STATEMENTS = (
+    """
+    PREPARE get_indicator_id (text) AS
+        SELECT indicator_id FROM indicators WHERE series_id = $1
+    """,
+    """
+    PREPARE update_indicator_last_updated (text) AS
+        UPDATE indicators
+        SET last_updated = CURRENT_TIMESTAMP
+        WHERE series_id = $1
+    """,
+    """
+    PREPARE update_indicators_last_updated (text[]) AS
+        UPDATE indicators
+        SET last_updated = CURRENT_TIMESTAMP
+        WHERE series_id = ANY($1)
+    """,
+    """
+    PREPARE log_etl_run (text, integer, text, numeric) AS
+        INSERT INTO etl_logs (status, records_processed, error_message, execution_time_seconds)
+        VALUES ($1, $2, $3, $4)
+    """,
+    """
+    PREPARE get_latest_observation_date (text) AS
+        SELECT MAX(observation_date)
+        FROM indicator_data
+        WHERE indicator_id = (
+            SELECT indicator_id FROM indicators WHERE series_id = $1
+        )
+    """,
+)
+
 class DatabaseHandler:
     """Handle PostgreSQL database operations"""
 
@@ -18,111 +57,370 @@ class DatabaseHandler:
         self.conn = None
 
     def connect(self):
-        """Establish database connection"""
+        """
+        Establish database connection, reusing the current one if it is
+        still alive (e.g. across warm Lambda invocations)
+        """
+        if self.conn is not None and not self.conn.closed:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.close()
+                self.conn.rollback()
+                logger.info("Reusing database connection")
+                return
+            except psycopg2.Error:
+                logger.info("Database connection is stale, reconnecting")
+                self.close()
+        self.conn = None
+
         try:
             self.conn = psycopg2.connect(
                 host=self.db_config['host'],
                 database=self.db_config['database'],
                 user=self.db_config['user'],
                 password=self.db_config['password'],
-                port=self.db_config.get('port', 5432)
+                port=self.db_config.get('port', 5432),
+                # Detect connections silently dropped while the container is idle
+                keepalives=1,
+                keepalives_idle=30,
+                keepalives_interval=10
             )
+            self._prepare_statements()
             logger.info("Database connection established")
         except Exception as e:
+            # Don't leak the server-side connection if preparing statements failed
+            if self.conn is not None:
+                try:
+                    self.conn.close()
+                except Exception:
+                    pass
+            self.conn = None
             logger.error(f"Database connection error: {str(e)}")
             raise
 
+    def _prepare_statements(self):
+        """Prepare the frequently used statements on the current connection"""
+        cursor = self.conn.cursor()
+        try:
+            for statement in PREPARED_STATEMENTS:
+                cursor.execute(statement)
+            self.conn.commit()
+        finally:
+            cursor.close()
+
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
             logger.info("Database connection closed")
 
-    def get_indicator_id(self, series_id: str) -> int:
+    def reset(self):
+        """
+        Roll back anything left uncommitted so the open connection can be
+        reused by the next connect()
+        """
+        if self.conn is not None and not self.conn.closed:
+            try:
+                self.conn.rollback()
+            except psycopg2.Error as e:
+                logger.warning(f"Error resetting database connection: {str(e)}")
+
+    @contextmanager
+    def txn(self):
+        """
+        Run several operations in a single transaction
+
+        Commits once when the block exits, or rolls back if it raises.
+
+        Yields:
+            Cursor to pass as the cursor argument of the other methods
+        """
+        cursor = self.conn.cursor()
+        try:
+            yield cursor
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def savepoint(self, cursor, name: str = 'batch_item'):
+        """
+        Wrap part of a txn() block in a savepoint so that an error only
+        undoes that part and the transaction stays usable
+
+        Args:
+            cursor: Cursor yielded by txn()
+            name: Savepoint name
+        """
+        cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        else:
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+
+    def get_indicator_id(self, series_id: str, cursor=None) -> int:
         """
         Get indicator_id for a given series_id
 
         Args:
             series_id: FRED series ID
+            cursor: Optional cursor from txn() to reuse
 
         Returns:
             indicator_id from database
         """
-        cursor = self.conn.cursor()
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
         try:
-            cursor.execute(
-                "SELECT indicator_id FROM indicators WHERE series_id = %s",
-                (series_id,)
-            )
+            cursor.execute("EXECUTE get_indicator_id(%s)", (series_id,))
             result = cursor.fetchone()
             if result:
                 return result[0]
             else:
                 raise ValueError(f"Indicator {series_id} not found in database")
         finally:
-            cursor.close()
+            if own_cursor:
+                cursor.close()
+
+    def get_indicator_id_map(self, series_ids: List[str], cursor=None) -> Dict[str, int]:
+        """
+        Look up the indicator_id of several series in one query
+
+        Args:
+            series_ids: FRED series IDs
+            cursor: Optional cursor from txn() to reuse
+
+        Returns:
+            Dictionary mapping series_id to indicator_id; series missing from
+            the indicators table are left out
+        """
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT series_id, indicator_id FROM indicators WHERE series_id = ANY(%s)",
+                (list(series_ids),)
+            )
+            return dict(cursor.fetchall())
+        finally:
+            if own_cursor:
+                cursor.close()
+
+    def register_indicators(self, indicators: List[Dict], cursor=None) -> Dict[str, int]:
+        """
+        Add indicators to the indicators table in one statement
+
+        Args:
+            indicators: List of dictionaries with 'series_id', 'title', 'units',
+                'frequency' and 'seasonal_adjustment'
+            cursor: Optional cursor from txn(); the caller then owns the commit
+
+        Returns:
+            Dictionary mapping series_id to the new indicator_id; series that
+            already existed are left out
+        """
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
+
+        data = [
+            (ind['series_id'], ind['title'], ind.get('units'),
+             ind.get('frequency'), ind.get('seasonal_adjustment'))
+            for ind in indicators
+        ]
+
+        try:
+            rows = execute_values(cursor, """
+                INSERT INTO indicators (series_id, title, units, frequency, seasonal_adjustment)
+                VALUES %s
+                ON CONFLICT (series_id) DO NOTHING
+                RETURNING series_id, indicator_id
+            """, data, fetch=True)
+            if own_cursor:
+                self.conn.commit()
+            logger.info(f"Registered {len(rows)} new indicators")
+            return dict(rows)
+        except Exception as e:
+            if own_cursor:
+                self.conn.rollback()
+            logger.error(f"Error registering indicators: {str(e)}")
+            raise
+        finally:
+            if own_cursor:
+                cursor.close()
 
-    def upsert_indicator_data(self, indicator_id: int, observations: List[Dict]) -> int:
+    def upsert_indicator_data(self, indicator_id: int, observations: List[Dict],
+                              cursor=None) -> int:
         """
         Insert or update indicator data
 
         Args:
             indicator_id: ID from indicators table
             observations: List of observation dictionaries with 'date' and 'value'
+            cursor: Optional cursor from txn(); the caller then owns the commit
 
         Returns:
             Number of records processed
         """
-        cursor = self.conn.cursor()
+        if len(observations) >= BULK_LOAD_THRESHOLD:
+            return self.bulk_load_indicator_data(indicator_id, observations, cursor=cursor)
 
-        # Prepare data for batch insert
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
+
+        # Prepare data for batch insert. Values stay as FRED's decimal strings;
+        # PostgreSQL parses them into the DECIMAL column exactly, which saves a
+        # float() round trip per row
         data = [
-            (indicator_id, obs['date'], float(obs['value']) if obs['value'] != '.' else None)
+            (indicator_id, obs['date'], obs['value'])
             for obs in observations
             if obs['value'] != '.'  # FRED uses '.' for missing values
         ]
 
         try:
-            # Use INSERT ... ON CONFLICT to handle duplicates
-            execute_batch(cursor, """
+            # Use a multi-row INSERT ... ON CONFLICT to handle duplicates
+            execute_values(cursor, """
                 INSERT INTO indicator_data (indicator_id, observation_date, value)
-                VALUES (%s, %s, %s)
+                VALUES %s
                 ON CONFLICT (indicator_id, observation_date)
                 DO UPDATE SET value = EXCLUDED.value
-            """, data)
+            """, data, page_size=1000)
 
-            self.conn.commit()
+            if own_cursor:
+                self.conn.commit()
             logger.info(f"Processed {len(data)} records for indicator_id {indicator_id}")
             return len(data)
         except Exception as e:
-            self.conn.rollback()
+            if own_cursor:
+                self.conn.rollback()
             logger.error(f"Error inserting data: {str(e)}")
             raise
         finally:
-            cursor.close()
+            if own_cursor:
+                cursor.close()
 
-    def update_indicator_last_updated(self, series_id: str):
+    def bulk_load_indicator_data(self, indicator_id: int, observations: List[Dict],
+                                 cursor=None) -> int:
+        """
+        Insert or update a large batch of indicator data
+
+        Rows are streamed with COPY into a temporary staging table and merged
+        with a single INSERT ... SELECT ... ON CONFLICT.
+
+        Args:
+            indicator_id: ID from indicators table
+            observations: List of observation dictionaries with 'date' and 'value'
+            cursor: Optional cursor from txn(); the caller then owns the commit
+
+        Returns:
+            Number of records processed
+        """
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
+
+        rows = [
+            f"{indicator_id}\t{obs['date']}\t{obs['value']}\n"
+            for obs in observations
+            if obs['value'] != '.'  # FRED uses '.' for missing values
+        ]
+        buffer = io.StringIO()
+        buffer.writelines(rows)
+        buffer.seek(0)
+
+        try:
+            cursor.execute("""
+                CREATE TEMP TABLE stg_indicator_data (
+                    indicator_id INTEGER,
+                    observation_date DATE,
+                    value DECIMAL(18, 4)
+                ) ON COMMIT DROP
+            """)
+            cursor.copy_expert("""
+                COPY stg_indicator_data (indicator_id, observation_date, value)
+                FROM STDIN WITH (FORMAT text)
+            """, buffer)
+            cursor.execute("""
+                INSERT INTO indicator_data (indicator_id, observation_date, value)
+                SELECT indicator_id, observation_date, value FROM stg_indicator_data
+                ON CONFLICT (indicator_id, observation_date)
+                DO UPDATE SET value = EXCLUDED.value
+            """)
+            # Dropped explicitly too, so several loads can share one transaction
+            cursor.execute("DROP TABLE stg_indicator_data")
+
+            if own_cursor:
+                self.conn.commit()
+            logger.info(f"Bulk loaded {len(rows)} records for indicator_id {indicator_id}")
+            return len(rows)
+        except Exception as e:
+            if own_cursor:
+                self.conn.rollback()
+            logger.error(f"Error bulk loading data: {str(e)}")
+            raise
+        finally:
+            if own_cursor:
+                cursor.close()
+
+    def update_indicator_last_updated(self, series_id: str, cursor=None):
         """
         Update the last_updated timestamp for an indicator
 
         Args:
             series_id: FRED series ID
+            cursor: Optional cursor from txn(); the caller then owns the commit
         """
-        cursor = self.conn.cursor()
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
         try:
-            cursor.execute("""
-                UPDATE indicators
-                SET last_updated = CURRENT_TIMESTAMP
-                WHERE series_id = %s
-            """, (series_id,))
-            self.conn.commit()
+            cursor.execute("EXECUTE update_indicator_last_updated(%s)", (series_id,))
+            if own_cursor:
+                self.conn.commit()
             logger.info(f"Updated last_updated timestamp for {series_id}")
         except Exception as e:
-            self.conn.rollback()
+            if own_cursor:
+                self.conn.rollback()
             logger.error(f"Error updating last_updated: {str(e)}")
             raise
         finally:
-            cursor.close()
+            if own_cursor:
+                cursor.close()
+
+    def update_indicators_last_updated(self, series_ids: List[str], cursor=None):
+        """
+        Update the last_updated timestamp for several indicators in one statement
+
+        Args:
+            series_ids: FRED series IDs
+            cursor: Optional cursor from txn(); the caller then owns the commit
+        """
+        own_cursor = cursor is None
+        if own_cursor:
+            cursor = self.conn.cursor()
+        try:
+            cursor.execute("EXECUTE update_indicators_last_updated(%s)", (list(series_ids),))
+            if own_cursor:
+                self.conn.commit()
+            logger.info(f"Updated last_updated timestamp for {', '.join(series_ids)}")
+        except Exception as e:
+            if own_cursor:
+                self.conn.rollback()
+            logger.error(f"Error updating last_updated: {str(e)}")
+            raise
+        finally:
+            if own_cursor:
+                cursor.close()
 
     def log_etl_run(self, status: str, records_processed: int,
                     error_message: str = None, execution_time: float = None):
@@ -141,10 +439,10 @@ class DatabaseHandler:
 
         cursor = self.conn.cursor()
         try:
-            cursor.execute("""
-                INSERT INTO etl_logs (status, records_processed, error_message, execution_time_seconds)
-                VALUES (%s, %s, %s, %s)
-            """, (status, records_processed, error_message, execution_time))
+            cursor.execute(
+                "EXECUTE log_etl_run(%s, %s, %s, %s)",
+                (status, records_processed, error_message, execution_time)
+            )
 
             self.conn.commit()
             logger.info("ETL run logged to database")
@@ -166,13 +464,7 @@ class DatabaseHandler:
         """
         cursor = self.conn.cursor()
         try:
-            cursor.execute("""
-                SELECT MAX(observation_date)
-                FROM indicator_data
-                WHERE indicator_id = (
-                    SELECT indicator_id FROM indicators WHERE series_id = %s
-                )
-            """, (series_id,))
+            cursor.execute("EXECUTE get_latest_observation_date(%s)", (series_id,))
             result = cursor.fetchone()
             if result and result[0]:
                 return result[0].strftime('%Y-%m-%d')
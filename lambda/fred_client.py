@@ -1,13 +1,30 @@
 """
 FRED API Client for fetching economic indicator data
 """
+import threading
+import time
 import requests
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List
 import logging
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Series metadata rarely changes, so responses are kept for a day and shared by
+# every client in the process (and across warm Lambda invocations). The cache
+# is an LRU capped at SERIES_INFO_CACHE_SIZE entries.
+SERIES_INFO_TTL_SECONDS = 86400
+SERIES_INFO_CACHE_SIZE = 256
+_series_info_cache = OrderedDict()
+_series_info_lock = threading.Lock()
+
+# Seconds to wait for FRED to connect or send data before giving up, so a
+# stalled request fails fast instead of running into the Lambda timeout
+REQUEST_TIMEOUT = 10.0
+
 class FREDClient:
     """Client for interacting with FRED API"""
 
@@ -15,6 +32,17 @@ class FREDClient:
         self.api_key = api_key
         self.base_url = "https://api.stlouisfed.org/fred"
 
+        # Reuse pooled keep-alive connections so repeated calls to the same
+        # host skip the TCP and TLS handshakes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+
     def get_series_data(self, series_id: str, start_date: str = None) -> Dict:
         """
         Fetch time series data for a given indicator
@@ -38,7 +66,7 @@ class FREDClient:
             params['observation_start'] = start_date
 
         try:
-            response = requests.get(endpoint, params=params)
+            response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logger.info(f"Successfully fetched data for {series_id}")
             return response.json()
@@ -48,7 +76,7 @@ class FREDClient:
 
     def get_series_info(self, series_id: str) -> Dict:
         """
-        Fetch metadata about a series
+        Fetch metadata about a series, reusing a cached response for up to a day
 
         Args:
             series_id: FRED series ID
@@ -56,6 +84,13 @@ class FREDClient:
         Returns:
             Dictionary containing series metadata
         """
+        cache_key = (self.api_key, series_id)
+        with _series_info_lock:
+            cached = _series_info_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < SERIES_INFO_TTL_SECONDS:
+                _series_info_cache.move_to_end(cache_key)
+                return cached[1]
+
         endpoint = f"{self.base_url}/series"
 
         params = {
@@ -65,10 +100,16 @@ class FREDClient:
         }
 
         try:
-            response = requests.get(endpoint, params=params)
+            response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logger.info(f"Successfully fetched metadata for {series_id}")
-            return response.json()
+            info = response.json()
+            with _series_info_lock:
+                _series_info_cache[cache_key] = (time.monotonic(), info)
+                _series_info_cache.move_to_end(cache_key)
+                while len(_series_info_cache) > SERIES_INFO_CACHE_SIZE:
+                    _series_info_cache.popitem(last=False)
+            return info
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching metadata for {series_id}: {str(e)}")
             raise
@@ -3,6 +3,7 @@ Main Lambda Function for Economic Indicator ETL Pipeline
 """
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from fred_client import FREDClient
 from s3_handler import S3Handler
@@ -15,6 +16,54 @@ logger.setLevel(logging.INFO)
 # Indicators to track
 INDICATORS = ['UNRATE', 'CPIAUCSL', 'GDP', 'FEDFUNDS', 'DGS10']
 
+# Threads used to upload raw FRED responses to S3
+S3_UPLOAD_WORKERS = 8
+
+# Separator line for local run output
+_SEP = "=" * 60
+
+# Clients are built on the first invocation and reused by warm invocations of
+# the same container. They are not built at import time because local runs
+# load .env only after importing this module.
+_clients = None
+
+def _get_clients():
+    """
+    Return the container-wide (FREDClient, S3Handler, DatabaseHandler),
+    creating them from environment variables on first use
+    """
+    global _clients
+    if _clients is None:
+        db_config = {
+            'host': os.environ.get('DB_HOST'),
+            'database': os.environ.get('DB_NAME'),
+            'user': os.environ.get('DB_USER'),
+            'password': os.environ.get('DB_PASSWORD'),
+            'port': int(os.environ.get('DB_PORT', 5432))
+        }
+        _clients = (
+            FREDClient(os.environ.get('FRED_API_KEY')),
+            S3Handler(os.environ.get('S3_BUCKET_NAME')),
+            DatabaseHandler(db_config)
+        )
+    return _clients
+
+def _indicator_metadata(fred_client, series_id):
+    """
+    Build an indicators table row for a series from its FRED metadata
+
+    Returns:
+        Dictionary accepted by DatabaseHandler.register_indicators
+    """
+    info = fred_client.get_series_info(series_id)['seriess'][0]
+    return {
+        'series_id': series_id,
+        'title': info['title'],
+        'units': info.get('units'),
+        'frequency': info.get('frequency'),
+        'seasonal_adjustment': info.get('seasonal_adjustment')
+    }
+
 def lambda_handler(event, context):
     """
     Main Lambda handler function
@@ -28,21 +77,8 @@ def lambda_handler(event, context):
     start_time = datetime.now()
     total_records = 0
 
-    # Load configuration from environment variables
-    fred_api_key = os.environ.get('FRED_API_KEY')
-    s3_bucket = os.environ.get('S3_BUCKET_NAME')
-    db_config = {
-        'host': os.environ.get('DB_HOST'),
-        'database': os.environ.get('DB_NAME'),
-        'user': os.environ.get('DB_USER'),
-        'password': os.environ.get('DB_PASSWORD'),
-        'port': int(os.environ.get('DB_PORT', 5432))
-    }
-
-    # Initialize clients
-    fred_client = FREDClient(fred_api_key)
-    s3_handler = S3Handler(s3_bucket)
-    db_handler = DatabaseHandler(db_config)
+    # Reuse clients across warm invocations
+    fred_client, s3_handler, db_handler = _get_clients()
 
     try:
         # Connect to database
@@ -51,39 +87,94 @@ def lambda_handler(event, context):
         # Calculate start date (fetch last 10 years of data for historical analysis)
         start_date = (datetime.now() - timedelta(days=3650)).strftime('%Y-%m-%d')
 
-        # Process each indicator
-        for series_id in INDICATORS:
-            logger.info(f"Processing indicator: {series_id}")
-
-            try:
-                # Fetch data from FRED
-                data = fred_client.get_series_data(series_id, start_date=start_date)
-
-                # Save raw data to S3
-                s3_handler.save_raw_data(series_id, data)
-
-                # Get indicator ID from database
-                indicator_id = db_handler.get_indicator_id(series_id)
-
-                # Extract observations
-                observations = data.get('observations', [])
-
-                # Load data into database
-                records_processed = db_handler.upsert_indicator_data(
-                    indicator_id,
-                    observations
-                )
-
-                # Update last_updated timestamp
-                db_handler.update_indicator_last_updated(series_id)
-
-                total_records += records_processed
-                logger.info(f"Successfully processed {records_processed} records for {series_id}")
+        # Fetch all indicators from FRED concurrently
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=len(INDICATORS)) as executor:
+            futures = {
+                executor.submit(fred_client.get_series_data, series_id, start_date): series_id
+                for series_id in INDICATORS
+            }
+            for future in as_completed(futures):
+                series_id = futures[future]
+                try:
+                    fetched[series_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {series_id}: {str(e)}")
+
+        # Save raw data to S3 in the background while the database load runs
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as upload_executor:
+            uploads = {
+                upload_executor.submit(s3_handler.save_raw_data, series_id, data): series_id
+                for series_id, data in fetched.items()
+            }
 
-            except Exception as e:
-                logger.error(f"Error processing {series_id}: {str(e)}")
-                # Continue with next indicator
-                continue
+            loaded = []
+            # Rows upserted in the load transaction; they only count towards
+            # total_records once it commits, since a rollback discards them
+            loaded_records = 0
+
+            # Look up every indicator ID in one query
+            with db_handler.txn() as cursor:
+                indicator_ids = db_handler.get_indicator_id_map(fetched, cursor=cursor)
+
+            # Fetch FRED metadata for series not in the indicators table yet,
+            # before the load transaction so it is not held open over HTTP
+            new_indicators = []
+            for series_id in fetched:
+                if series_id in indicator_ids:
+                    continue
+                try:
+                    new_indicators.append(_indicator_metadata(fred_client, series_id))
+                except Exception as e:
+                    logger.error(f"Error fetching metadata for {series_id}: {str(e)}")
+
+            # Process all indicators in one transaction; each indicator gets a
+            # savepoint so a failure only discards that indicator's changes
+            with db_handler.txn() as cursor:
+                if new_indicators:
+                    indicator_ids.update(db_handler.register_indicators(new_indicators, cursor=cursor))
+
+                for series_id in INDICATORS:
+                    if series_id not in fetched or series_id not in indicator_ids:
+                        continue
+
+                    logger.info(f"Processing indicator: {series_id}")
+                    data = fetched[series_id]
+
+                    try:
+                        with db_handler.savepoint(cursor):
+                            # Extract observations
+                            observations = data.get('observations', [])
+
+                            # Load data into database
+                            records_processed = db_handler.upsert_indicator_data(
+                                indicator_ids[series_id],
+                                observations,
+                                cursor=cursor
+                            )
+
+                        loaded.append(series_id)
+                        loaded_records += records_processed
+                        logger.info(f"Successfully processed {records_processed} records for {series_id}")
+
+                    except Exception as e:
+                        logger.error(f"Error processing {series_id}: {str(e)}")
+                        # Continue with next indicator
+                        continue
+
+                # Update last_updated for every loaded indicator at once
+                if loaded:
+                    db_handler.update_indicators_last_updated(loaded, cursor=cursor)
+
+            total_records += loaded_records
+
+            # Wait for the uploads; an S3 failure does not undo the database load
+            for future in as_completed(uploads):
+                series_id = uploads[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error saving {series_id} to S3: {str(e)}")
 
         # Calculate execution time
         execution_time = (datetime.now() - start_time).total_seconds()
@@ -121,37 +212,34 @@ def lambda_handler(event, context):
         }
 
     finally:
-        # Clean up
-        db_handler.close()
+        # Leave the connection open for the next warm invocation
+        db_handler.reset()
 
 # For local testing
 if __name__ == "__main__":
     # Load environment variables from .env file for local testing
     from dotenv import load_dotenv
-    import os
     # Load .env from parent directory
     env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
     load_dotenv(dotenv_path=env_path)
 
     # Debug: Check environment variables
-    print("=" * 60)
-    print("Environment Variables Check:")
-    print(f"DB_HOST: {os.environ.get('DB_HOST')}")
-    print(f"S3_BUCKET_NAME: {os.environ.get('S3_BUCKET_NAME')}")
-    print(f"FRED_API_KEY: {'SET' if os.environ.get('FRED_API_KEY') else 'NOT SET'}")
-    print("=" * 60)
-
-    # Mock event and context for local testing
-    print("=" * 60)
-    print("Running Lambda function locally...")
-    print("=" * 60)
-    print()
+    print(f"""{_SEP}
+Environment Variables Check:
+DB_HOST: {os.environ.get('DB_HOST')}
+S3_BUCKET_NAME: {os.environ.get('S3_BUCKET_NAME')}
+FRED_API_KEY: {'SET' if os.environ.get('FRED_API_KEY') else 'NOT SET'}
+{_SEP}
+{_SEP}
+Running Lambda function locally...
+{_SEP}
+""")
 
     result = lambda_handler({}, None)
 
-    print()
-    print("=" * 60)
-    print("Execution Result:")
-    print("=" * 60)
-    print(f"Status Code: {result['statusCode']}")
-    print(f"Body: {result['body']}")
+    print(f"""
+{_SEP}
+Execution Result:
+{_SEP}
+Status Code: {result['statusCode']}
+Body: {result['body']}""")
@@ -2,69 +2,165 @@
 S3 Handler for storing raw economic indicator data
 """
 import boto3
-import json
-from datetime import datetime
-from typing import Dict, List
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+import gzip
+import hashlib
+import io
+import orjson
+import time
+from typing import Dict, Iterator, Optional, Tuple
 import logging
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# FRED responses are very repetitive JSON; level 4 gets most of the size
+# reduction at a fraction of the CPU cost of level 9
+GZIP_COMPRESSLEVEL = 4
+
+# Bodies above 8MB are uploaded as multipart chunks in parallel; smaller ones
+# still go up in a single PUT
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# boto3 clients are expensive to build and thread-safe, so one is shared by
+# every S3Handler in the process (and across warm Lambda invocations)
+_s3_client = None
+
+def _get_s3_client():
+    """Return the process-wide S3 client, creating it on first use"""
+    global _s3_client
+    if _s3_client is None:
+        # The default pool of 10 connections is too small for threaded uploads
+        _s3_client = boto3.client('s3', config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'mode': 'standard'}
+        ))
+    return _s3_client
+
 class S3Handler:
     """Handle S3 operations for raw data storage"""
 
     def __init__(self, bucket_name: str):
-        self.s3_client = boto3.client('s3')
+        self.s3_client = _get_s3_client()
         self.bucket_name = bucket_name
 
     def save_raw_data(self, series_id: str, data: Dict) -> str:
         """
-        Save raw FRED API response to S3
+        Save raw FRED API response to S3 as gzip-compressed JSON
 
         Args:
             series_id: FRED series ID
             data: Raw API response data
 
         Returns:
-            S3 object key
+            S3 object key; the latest existing key if the observations are
+            unchanged since the last upload
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        key = f"raw/{series_id}/{timestamp}.json"
+        digest = self._content_hash(data)
+        latest_key, latest_digest = self._latest_upload(series_id)
+        if latest_digest == digest:
+            logger.info(f"Raw data for {series_id} unchanged since s3://{self.bucket_name}/{latest_key}")
+            return latest_key
+
+        # UTC keeps key order chronological regardless of the host time zone
+        timestamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+        key = f"raw/{series_id}/{timestamp}.json.gz"
 
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=json.dumps(data),
-                ContentType='application/json'
+            body = gzip.compress(orjson.dumps(data), compresslevel=GZIP_COMPRESSLEVEL)
+            self.s3_client.upload_fileobj(
+                io.BytesIO(body),
+                self.bucket_name,
+                key,
+                ExtraArgs={
+                    'ContentType': 'application/json',
+                    'ContentEncoding': 'gzip',
+                    'Metadata': {'content-hash': digest}
+                },
+                Config=TRANSFER_CONFIG
             )
             logger.info(f"Saved raw data to s3://{self.bucket_name}/{key}")
-            return key
         except Exception as e:
             logger.error(f"Error saving to S3: {str(e)}")
             raise
 
-    def list_raw_files(self, series_id: str = None) -> List[str]:
+        self._save_latest_upload(series_id, key, digest)
+        return key
+
+    @staticmethod
+    def _content_hash(data: Dict) -> str:
         """
-        List raw data files in S3
+        Hash the (date, value) pairs of a FRED response
 
-        Args:
-            series_id: Optional filter by series ID
+        The realtime_* fields change on every request, so hashing the whole
+        response would never match.
+        """
+        pairs = [[obs['date'], obs['value']] for obs in data.get('observations', [])]
+        return hashlib.sha256(orjson.dumps(pairs)).hexdigest()
+
+    @staticmethod
+    def _latest_pointer_key(series_id: str) -> str:
+        """Key of the small object recording a series' newest raw upload"""
+        return f"latest/{series_id}.json"
+
+    def _latest_upload(self, series_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read the newest raw key for a series and its content hash from the
+        series' pointer object (one GET, however much history is stored)
 
         Returns:
-            List of S3 object keys
+            (key, content hash), or (None, None) if there is no usable pointer
         """
-        prefix = f"raw/{series_id}/" if series_id else "raw/"
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=self._latest_pointer_key(series_id)
+            )
+            pointer = orjson.loads(response['Body'].read())
+            return pointer['key'], pointer['content_hash']
+        except self.s3_client.exceptions.NoSuchKey:
+            return None, None
+        except Exception as e:
+            logger.warning(f"Could not check previous upload for {series_id}: {str(e)}")
+            return None, None
 
+    def _save_latest_upload(self, series_id: str, key: str, digest: str) -> None:
+        """Point the series' pointer object at a new raw upload"""
         try:
-            response = self.s3_client.list_objects_v2(
+            self.s3_client.put_object(
                 Bucket=self.bucket_name,
-                Prefix=prefix
+                Key=self._latest_pointer_key(series_id),
+                Body=orjson.dumps({'key': key, 'content_hash': digest}),
+                ContentType='application/json'
             )
+        except Exception as e:
+            # The upload itself succeeded; the next run just uploads again
+            logger.warning(f"Could not update latest upload for {series_id}: {str(e)}")
+
+    def list_raw_files(self, series_id: str = None) -> Iterator[str]:
+        """
+        List raw data files in S3, following pagination
 
-            if 'Contents' in response:
-                return [obj['Key'] for obj in response['Contents']]
-            return []
+        Args:
+            series_id: Optional filter by series ID
+
+        Returns:
+            Iterator over S3 object keys, fetched one page at a time
+        """
+        prefix = f"raw/{series_id}/" if series_id else "raw/"
+
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix,
+                                           PaginationConfig={'PageSize': 1000}):
+                yield from (obj['Key'] for obj in page.get('Contents', []))
         except Exception as e:
             logger.error(f"Error listing S3 objects: {str(e)}")
             raise
@@ -84,7 +180,11 @@ class S3Handler:
                 Bucket=self.bucket_name,
                 Key=key
             )
-            data = json.loads(response['Body'].read())
+            body = response['Body'].read()
+            # Objects saved before compression was added are plain JSON
+            if key.endswith('.gz') or response.get('ContentEncoding') == 'gzip':
+                body = gzip.decompress(body)
+            data = orjson.loads(body)
             logger.info(f"Retrieved data from s3://{self.bucket_name}/{key}")
             return data
         except Exception as e:
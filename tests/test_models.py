@@ -0,0 +1,73 @@
+"""
+Tests for the ARIMA model cache in forecasting/models.py
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('statsmodels')
+
+from forecasting.models import EconomicForecaster
+
+
+def make_df(values, start='2015-01-01'):
+    """Monthly DataFrame in the shape the forecaster reads from the database"""
+    return pd.DataFrame({
+        'observation_date': pd.date_range(start, periods=len(values), freq='MS'),
+        'value': values
+    })
+
+
+@pytest.fixture
+def two_series():
+    """Two different series that share their first observation"""
+    rng = np.random.default_rng(0)
+    first = rng.normal(size=60).cumsum()
+    second = first * 2
+    second[0] = first[0]
+    return make_df(first), make_df(second)
+
+
+def test_series_sharing_first_point_keep_their_own_cache(tmp_path, two_series, capsys):
+    df_a, df_b = two_series
+    forecaster = EconomicForecaster(cache_dir=str(tmp_path))
+
+    forecaster.fit_arima(df_a, series_id='A')
+    forecaster.fit_arima(df_b, series_id='B')
+    assert len(os.listdir(tmp_path)) == 2
+
+    capsys.readouterr()
+    forecaster.fit_arima(df_a, series_id='A')
+    forecaster.fit_arima(df_b, series_id='B')
+    assert capsys.readouterr().out.count('loaded from cache') == 2
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_refit_with_new_data_replaces_only_that_series(tmp_path, two_series):
+    df_a, df_b = two_series
+    forecaster = EconomicForecaster(cache_dir=str(tmp_path))
+    forecaster.fit_arima(df_a, series_id='A')
+    forecaster.fit_arima(df_b, series_id='B')
+    before = set(os.listdir(tmp_path))
+
+    extended = make_df(np.append(df_a['value'].to_numpy(), 1.0))
+    forecaster.fit_arima(extended, series_id='A')
+
+    after = set(os.listdir(tmp_path))
+    assert len(after) == 2
+    assert len(before & after) == 1  # B's fit is untouched, A's was replaced
+
+
+def test_unreadable_cache_file_is_refitted(tmp_path, two_series, capsys):
+    df_a, _ = two_series
+    forecaster = EconomicForecaster(cache_dir=str(tmp_path))
+    forecaster.fit_arima(df_a, series_id='A')
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_bytes(b'\x80\x05truncated')
+
+    capsys.readouterr()
+    forecaster.fit_arima(df_a, series_id='A')
+    assert 'fitted successfully' in capsys.readouterr().out
+    assert forecaster.forecast_arima(steps=3)['forecast'].notna().all()
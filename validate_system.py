@@ -2,9 +2,12 @@
 System Validation Tests
 Tests all components before GitHub push
 """
+import io
 import os
 import sys
+import threading
 import psycopg2
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import boto3
 from datetime import datetime
@@ -20,6 +23,39 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
+class ThreadBufferedStdout:
+    """
+    Stand-in for sys.stdout that sends each thread's output to its own buffer
+    while one is set, so tests running concurrently don't interleave lines
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() etc. come from the real stdout
+        return getattr(self.stream, name)
+
+def run_buffered(stdout, test):
+    """Run a test with its output captured, returning (passed, output)"""
+    stdout.local.buffer = io.StringIO()
+    try:
+        passed = test()
+    except Exception as e:
+        print_test(test.__name__, False, str(e))
+        passed = False
+    output = stdout.local.buffer.getvalue()
+    stdout.local.buffer = None
+    return passed, output
+
 def print_header(text):
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
@@ -74,19 +110,40 @@ def test_database_connection():
         )
         print_test("Database connection", True, f"Connected to {os.getenv('DB_HOST')}")
 
-        # Test tables exist
+        # Test tables exist, using the planner's row estimates rather than a
+        # full COUNT(*) scan of each table
         cursor = conn.cursor()
 
         tables = ['indicators', 'indicator_data', 'etl_logs']
+        cursor.execute("""
+            SELECT relname, reltuples::bigint
+            FROM pg_class
+            WHERE relname = ANY(%s) AND relkind = 'r' AND pg_table_is_visible(oid)
+        """, (tables,))
+        estimates = dict(cursor.fetchall())
         for table in tables:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            print_test(f"Table '{table}' exists", True, f"{count} rows")
+            exists = table in estimates
+            if not exists:
+                detail = "Not found"
+            elif estimates[table] < 0:
+                # reltuples is -1 until the table is first vacuumed or analyzed
+                detail = "row count not estimated yet"
+            else:
+                detail = f"~{estimates[table]} rows"
+            print_test(f"Table '{table}' exists", exists, detail)
+        if len(estimates) < len(tables):
+            conn.close()
+            return False
 
         # Test data exists
-        cursor.execute("SELECT COUNT(*) FROM indicator_data")
-        data_count = cursor.fetchone()[0]
-        print_test("Data loaded", data_count > 0, f"{data_count} total data points")
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM indicator_data)")
+        has_data = cursor.fetchone()[0]
+        if estimates['indicator_data'] > 0:
+            detail = f"~{estimates['indicator_data']} total data points"
+        else:
+            # The estimate lags behind the table until it is analyzed
+            detail = "rows present" if has_data else "0 total data points"
+        print_test("Data loaded", has_data, detail)
 
         conn.close()
         return True
@@ -100,7 +157,7 @@ def test_s3_bucket():
     print_header("AWS S3 Bucket")
 
     try:
-        s3 = boto3.client('s3')
+        s3 = boto3.session.Session().client('s3')
         bucket = os.getenv('S3_BUCKET_NAME')
 
         # Check if bucket exists
@@ -123,7 +180,7 @@ def test_lambda_function():
     print_header("AWS Lambda Function")
 
     try:
-        lambda_client = boto3.client('lambda')
+        lambda_client = boto3.session.Session().client('lambda')
 
         response = lambda_client.get_function(
             FunctionName='economic-indicator-etl'
@@ -145,7 +202,7 @@ def test_cloudwatch_schedule():
     print_header("CloudWatch Events")
 
     try:
-        events = boto3.client('events')
+        events = boto3.session.Session().client('events')
 
         response = events.list_rules(NamePrefix='economic-indicator')
 
@@ -235,6 +292,7 @@ def test_visualization_outputs():
     expected_files = [
         'multi_indicator_dashboard.png',
         'interactive_dashboard.html',
+        'interactive_dashboard.js',
         'unemployment_rate_timeseries.png',
         'consumer_price_index_timeseries.png',
         'unemployment_rate_forecast.png',
@@ -269,17 +327,32 @@ def main():
     print(f"{'='*70}{Colors.END}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    results = {}
+    tests = [
+        ('Environment', test_environment_variables),
+        ('Database', test_database_connection),
+        ('S3', test_s3_bucket),
+        ('Lambda', test_lambda_function),
+        ('CloudWatch', test_cloudwatch_schedule),
+        ('Python Modules', test_python_modules),
+        ('Project Structure', test_project_structure),
+        ('Visualizations', test_visualization_outputs)
+    ]
+
+    # The tests are independent and mostly wait on the network, so run them
+    # concurrently and print their output in order once they have all finished
+    stdout = ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(run_buffered, stdout, test) for _, test in tests]
+    finally:
+        sys.stdout = stdout.stream
 
-    # Run all tests
-    results['Environment'] = test_environment_variables()
-    results['Database'] = test_database_connection()
-    results['S3'] = test_s3_bucket()
-    results['Lambda'] = test_lambda_function()
-    results['CloudWatch'] = test_cloudwatch_schedule()
-    results['Python Modules'] = test_python_modules()
-    results['Project Structure'] = test_project_structure()
-    results['Visualizations'] = test_visualization_outputs()
+    results = {}
+    for (name, _), future in zip(tests, futures):
+        passed, output = future.result()
+        sys.stdout.write(output)
+        results[name] = passed
 
     # Print summary
     print_header("Validation Summary")
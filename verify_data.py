@@ -30,75 +30,81 @@ def verify_data():
         print("=" * 60)
         print()
 
-        # Check table counts
+        # Gather all statistics in one query (one round trip, one consistent
+        # snapshot); dates and values are cast to text so they print as before
         cursor.execute("""
-            SELECT
-                (SELECT COUNT(*) FROM indicators) as indicators_count,
-                (SELECT COUNT(*) FROM indicator_data) as data_count,
-                (SELECT COUNT(*) FROM etl_logs) as logs_count;
+            WITH counts AS (
+                SELECT
+                    (SELECT COUNT(*) FROM indicators) as indicators_count,
+                    (SELECT COUNT(*) FROM indicator_data) as data_count,
+                    (SELECT COUNT(*) FROM etl_logs) as logs_count
+            ),
+            latest AS (
+                SELECT
+                    i.series_id,
+                    i.title,
+                    MAX(d.observation_date)::text as latest_date,
+                    COUNT(d.data_id) as total_records
+                FROM indicators i
+                LEFT JOIN indicator_data d ON i.indicator_id = d.indicator_id
+                GROUP BY i.series_id, i.title
+            ),
+            runs AS (
+                SELECT
+                    run_timestamp::text as run_timestamp,
+                    status,
+                    records_processed,
+                    execution_time_seconds
+                FROM etl_logs
+                ORDER BY etl_logs.run_timestamp DESC
+                LIMIT 5
+            ),
+            sample AS (
+                SELECT
+                    observation_date::text as observation_date,
+                    value::text as value
+                FROM indicator_data
+                WHERE indicator_id = (SELECT indicator_id FROM indicators WHERE series_id = 'UNRATE')
+                ORDER BY indicator_data.observation_date DESC
+                LIMIT 5
+            )
+            SELECT json_build_object(
+                'counts', (SELECT row_to_json(c) FROM counts c),
+                'latest', (SELECT COALESCE(json_agg(l ORDER BY l.series_id), '[]') FROM latest l),
+                'runs', (SELECT COALESCE(json_agg(r ORDER BY r.run_timestamp DESC), '[]') FROM runs r),
+                'sample', (SELECT COALESCE(json_agg(s ORDER BY s.observation_date DESC), '[]') FROM sample s)
+            );
         """)
-        counts = cursor.fetchone()
+        stats = cursor.fetchone()[0]
+        counts = stats['counts']
 
         print("Table Statistics:")
-        print(f"  - Indicators: {counts[0]} records")
-        print(f"  - Indicator Data: {counts[1]} records")
-        print(f"  - ETL Logs: {counts[2]} records")
+        print(f"  - Indicators: {counts['indicators_count']} records")
+        print(f"  - Indicator Data: {counts['data_count']} records")
+        print(f"  - ETL Logs: {counts['logs_count']} records")
         print()
 
         # Show latest data for each indicator
         print("Latest Data by Indicator:")
         print("-" * 60)
-        cursor.execute("""
-            SELECT
-                i.series_id,
-                i.title,
-                MAX(d.observation_date) as latest_date,
-                COUNT(d.data_id) as total_records
-            FROM indicators i
-            LEFT JOIN indicator_data d ON i.indicator_id = d.indicator_id
-            GROUP BY i.series_id, i.title
-            ORDER BY i.series_id;
-        """)
-
-        for row in cursor.fetchall():
-            print(f"  {row[0]:12s} | {row[2]} | {row[3]:4d} records | {row[1]}")
+        for row in stats['latest']:
+            print(f"  {row['series_id']:12s} | {row['latest_date']} | {row['total_records']:4d} records | {row['title']}")
 
         print()
 
         # Show most recent ETL run
         print("Most Recent ETL Runs:")
         print("-" * 60)
-        cursor.execute("""
-            SELECT
-                run_timestamp,
-                status,
-                records_processed,
-                execution_time_seconds
-            FROM etl_logs
-            ORDER BY run_timestamp DESC
-            LIMIT 5;
-        """)
-
-        for row in cursor.fetchall():
-            print(f"  {row[0]} | {row[1]:8s} | {row[2]:4d} records | {row[3]:.2f}s")
+        for row in stats['runs']:
+            print(f"  {row['run_timestamp']} | {row['status']:8s} | {row['records_processed']:4d} records | {row['execution_time_seconds']:.2f}s")
 
         print()
 
         # Show sample data (latest unemployment rate)
         print("Sample Data - Latest Unemployment Rates:")
         print("-" * 60)
-        cursor.execute("""
-            SELECT
-                observation_date,
-                value
-            FROM indicator_data
-            WHERE indicator_id = (SELECT indicator_id FROM indicators WHERE series_id = 'UNRATE')
-            ORDER BY observation_date DESC
-            LIMIT 5;
-        """)
-
-        for row in cursor.fetchall():
-            print(f"  {row[0]} | {row[1]}%")
+        for row in stats['sample']:
+            print(f"  {row['observation_date']} | {row['value']}%")
 
         cursor.close()
         conn.close()
@@ -4,31 +4,234 @@ Generates charts and plots for economic data analysis
 """
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
-from datetime import datetime
+import io
 import os
 
+# PNGs are written by Pillow; fast zlib compression makes saving several times
+# quicker for slightly larger files
+PNG_KWARGS = {'compress_level': 1, 'optimize': False}
+
+# Interactive traces longer than this are drawn with WebGL (Scattergl)
+# instead of SVG, which slows down past a few thousand points
+WEBGL_THRESHOLD = 2000
+
+# Interactive traces are thinned with LTTB to at most this many points, about
+# two per pixel of a wide browser window
+INTERACTIVE_MAX_POINTS = 4000
+
+# Page for the interactive dashboard. The figure JSON lives in a sidecar
+# script next to the page, loaded with a <script> tag rather than fetch() so
+# the page still works when opened straight from disk (file://)
+_DASHBOARD_HTML = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <title>Economic Indicators Interactive Dashboard</title>
+    <script charset="utf-8" src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js"></script>
+    <script charset="utf-8" src="{data_file}"></script>
+</head>
+<body>
+    <div id="dashboard" style="width:100%;"></div>
+    <script>
+        Plotly.newPlot('dashboard', window.DASHBOARD_FIGURE.data,
+                       window.DASHBOARD_FIGURE.layout, {{responsive: true}});
+    </script>
+</body>
+</html>
+"""
+
+# plot_batch only starts worker processes (an interpreter each, re-importing
+# matplotlib and pandas under spawn) when there is enough rendering to repay
+# it; a handful of monthly series is quicker to draw inline
+BATCH_PROCESS_MIN_CHARTS = 8
+BATCH_PROCESS_MIN_POINTS = 100_000
+
+# Chart generator of a plot_batch worker process, set up by _init_batch_worker
+_batch_charts = None
+
+def _init_batch_worker(output_dir, dpi):
+    """Create the EconomicCharts instance a plot_batch worker process renders with"""
+    global _batch_charts
+    _batch_charts = EconomicCharts(output_dir=output_dir, dpi=dpi)
+
+def _plot_time_series_worker(indicator_name, df):
+    """Save one time series chart in a plot_batch worker process"""
+    return _batch_charts.plot_time_series(df, indicator_name)
+
 class EconomicCharts:
     """Generate various charts for economic indicators"""
 
-    def __init__(self, output_dir='outputs/charts'):
+    # The style only needs loading once per process
+    _style_applied = False
+
+    def __init__(self, output_dir='outputs/charts', dpi=150):
         """
         Initialize chart generator
 
         Args:
             output_dir: Directory to save generated charts
+            dpi: Resolution of saved PNGs (use 300 for print quality)
         """
         self.output_dir = output_dir
+        self.dpi = dpi
         os.makedirs(output_dir, exist_ok=True)
 
+        # Figures for saved charts, keyed by (figsize, nrows) and reused
+        self._fig_cache = {}
+
+        # Empty interactive dashboard layouts, keyed by number of indicators
+        self._plotly_templates = {}
+
         # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
+        if not EconomicCharts._style_applied:
+            plt.style.use('seaborn-v0_8-darkgrid')
+            EconomicCharts._style_applied = True
+
+    def _subplots(self, figsize, nrows=1, save=True):
+        """
+        Create the figure and axes for a chart
+
+        Saved charts reuse a cached Agg figure of the same size at the output
+        DPI, cleared between calls, instead of building and closing a pyplot
+        figure each time. Charts that are shown use a regular pyplot figure.
+
+        Args:
+            figsize: Figure size in inches
+            nrows: Number of stacked axes
+            save: Whether the chart will be saved rather than shown
+
+        Returns:
+            (fig, axes) as returned by plt.subplots
+        """
+        if not save:
+            return plt.subplots(nrows, 1, figsize=figsize)
+
+        key = (figsize, nrows)
+        fig = self._fig_cache.get(key)
+        if fig is None:
+            fig = Figure(figsize=figsize, dpi=self.dpi)
+            FigureCanvasAgg(fig)
+            self._fig_cache[key] = fig
+        else:
+            fig.clear()
+        return fig, fig.subplots(nrows, 1)
 
-    def plot_time_series(self, df, indicator_name, title=None, save=True):
+    @staticmethod
+    def _write_png(fig, filepath):
+        """
+        Render a figure to PNG in memory and write the file with a single
+        os.write instead of the encoder's many small writes
+
+        Args:
+            fig: Figure with an Agg canvas, at the output DPI
+            filepath: Destination path
+        """
+        buffer = io.BytesIO()
+        fig.canvas.print_png(buffer, pil_kwargs=PNG_KWARGS)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(filepath, flags, 0o644)
+        try:
+            data = buffer.getbuffer()
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _date_nums(dates):
+        """
+        Convert dates to Matplotlib date numbers in one vectorized call
+
+        Args:
+            dates: Series or array of dates, datetimes or date strings
+
+        Returns:
+            float64 array of days since the Matplotlib epoch
+        """
+        return mdates.date2num(pd.to_datetime(dates).to_numpy())
+
+    @staticmethod
+    def _xy(df, x_col='observation_date', y_col='value', date_nums=False):
+        """
+        Extract plot coordinates as contiguous arrays, with float64 values
+
+        Args:
+            df: DataFrame holding the columns
+            x_col: Column for the x axis
+            y_col: Column for the y axis
+            date_nums: Whether to return x as Matplotlib date numbers, which
+                saves Matplotlib converting every date when plotting
+
+        Returns:
+            (x, y) NumPy arrays
+        """
+        if date_nums:
+            x = EconomicCharts._date_nums(df[x_col])
+        else:
+            x = np.ascontiguousarray(df[x_col].to_numpy())
+        y = np.ascontiguousarray(df[y_col].to_numpy(), dtype=np.float64)
+        return x, y
+
+    @staticmethod
+    def _lttb(x, y, n_out):
+        """
+        Downsample a series with Largest-Triangle-Three-Buckets
+
+        Keeps the first and last points and, from each of n_out - 2 equal
+        buckets in between, the point forming the largest triangle with the
+        previously kept point and the mean of the next bucket. This keeps
+        the visible shape of the line, including peaks.
+
+        Args:
+            x: x values (numbers or dates)
+            y: y values as floats
+            n_out: Number of points to keep
+
+        Returns:
+            (x, y) downsampled arrays
+        """
+        n = len(y)
+        if n_out >= n or n_out < 3:
+            return x, y
+
+        if np.issubdtype(x.dtype, np.number):
+            xf = x.astype(np.float64)
+        else:
+            xf = mdates.date2num(x)
+
+        edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+        keep = np.empty(n_out, dtype=np.intp)
+        keep[0], keep[-1] = 0, n - 1
+        prev = 0
+        for i in range(n_out - 2):
+            start, end = edges[i], edges[i + 1]
+            nxt = slice(end, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+            mean_x, mean_y = xf[nxt].mean(), y[nxt].mean()
+            area = np.abs((xf[prev] - mean_x) * (y[start:end] - y[prev])
+                          - (xf[prev] - xf[start:end]) * (mean_y - y[prev]))
+            prev = start + int(np.argmax(area))
+            keep[i + 1] = prev
+        return x[keep], y[keep]
+
+    def _downsample(self, fig, x, y, save=True):
+        """
+        Reduce a series to about two points per pixel of figure width with
+        LTTB, when it has more than four points per pixel
+
+        Returns:
+            (x, y), downsampled if needed
+        """
+        n_px = int(fig.get_size_inches()[0] * (self.dpi if save else fig.dpi))
+        if len(y) > 4 * n_px:
+            return self._lttb(x, y, 2 * n_px)
+        return x, y
+
+    def plot_time_series(self, df, indicator_name, title=None, save=True, downsample=True):
         """
         Create a time series plot for an indicator
 
@@ -37,14 +240,18 @@ class EconomicCharts:
             indicator_name: Name of the indicator
             title: Optional custom title
             save: Whether to save the plot
+            downsample: Whether to thin very long series (LTTB) before plotting
 
         Returns:
             Path to saved plot or None
         """
-        fig, ax = plt.subplots(figsize=(12, 6))
+        x, y = self._xy(df, date_nums=True)
+
+        fig, ax = self._subplots((12, 6), save=save)
 
-        ax.plot(df['observation_date'], df['value'],
-                linewidth=2, color='#2E86AB', label=indicator_name)
+        if downsample:
+            x, y = self._downsample(fig, x, y, save)
+        ax.plot(x, y, linewidth=2, color='#2E86AB', label=indicator_name)
 
         # Formatting
         ax.set_xlabel('Date', fontsize=12, fontweight='bold')
@@ -57,22 +264,70 @@ class EconomicCharts:
         # Format x-axis dates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-        plt.xticks(rotation=45, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save:
             filename = f"{indicator_name.lower().replace(' ', '_')}_timeseries.png"
             filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
+            self._write_png(fig, filepath)
             print(f"Saved: {filepath}")
-            plt.close()
             return filepath
         else:
             plt.show()
             return None
 
-    def plot_multiple_indicators(self, data_dict, title="Economic Indicators Dashboard", save=True):
+    def plot_batch(self, data_dict, workers=None, on_saved=None):
+        """
+        Save a time series chart for each indicator, rendering them in
+        parallel worker processes when the batch is large enough
+
+        Args:
+            data_dict: Dictionary {indicator_name: df} with DataFrames
+            workers: Number of worker processes. By default one per CPU (at
+                most one per indicator), but only for batches of at least
+                BATCH_PROCESS_MIN_CHARTS charts or BATCH_PROCESS_MIN_POINTS
+                observations; smaller batches are rendered inline
+            on_saved: Optional function called with (indicator_name, filepath)
+                as each chart is saved
+
+        Returns:
+            List of paths to the saved plots, in data_dict order
+        """
+        if workers is None:
+            n_points = sum(len(df) for df in data_dict.values())
+            if len(data_dict) >= BATCH_PROCESS_MIN_CHARTS or n_points >= BATCH_PROCESS_MIN_POINTS:
+                workers = os.cpu_count() or 1
+            else:
+                workers = 1
+        workers = min(workers, len(data_dict))
+
+        if workers <= 1:
+            paths = []
+            for name, df in data_dict.items():
+                paths.append(self.plot_time_series(df, name))
+                if on_saved:
+                    on_saved(name, paths[-1])
+            return paths
+
+        paths = {}
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.output_dir, self.dpi)) as executor:
+            futures = {
+                executor.submit(_plot_time_series_worker, name, df): name
+                for name, df in data_dict.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                paths[name] = future.result()
+                if on_saved:
+                    on_saved(name, paths[name])
+        return [paths[name] for name in data_dict]
+
+    def plot_multiple_indicators(self, data_dict, title="Economic Indicators Dashboard", save=True,
+                                 downsample=True):
         """
         Create a multi-panel plot for multiple indicators
 
@@ -80,22 +335,26 @@ class EconomicCharts:
             data_dict: Dictionary {indicator_name: df} with DataFrames
             title: Dashboard title
             save: Whether to save the plot
+            downsample: Whether to thin very long series (LTTB) before plotting
 
         Returns:
             Path to saved plot or None
         """
         n_indicators = len(data_dict)
-        fig, axes = plt.subplots(n_indicators, 1, figsize=(14, 4*n_indicators))
+        series = {name: self._xy(df, date_nums=True) for name, df in data_dict.items()}
+
+        fig, axes = self._subplots((14, 4*n_indicators), n_indicators, save=save)
 
         if n_indicators == 1:
             axes = [axes]
 
         colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E']
 
-        for idx, (indicator_name, df) in enumerate(data_dict.items()):
+        for idx, (indicator_name, (x, y)) in enumerate(series.items()):
             ax = axes[idx]
-            ax.plot(df['observation_date'], df['value'],
-                   linewidth=2, color=colors[idx % len(colors)], label=indicator_name)
+            if downsample:
+                x, y = self._downsample(fig, x, y, save)
+            ax.plot(x, y, linewidth=2, color=colors[idx % len(colors)], label=indicator_name)
 
             ax.set_ylabel('Value', fontsize=10, fontweight='bold')
             ax.set_title(indicator_name, fontsize=12, fontweight='bold', loc='left')
@@ -109,13 +368,12 @@ class EconomicCharts:
 
         axes[-1].set_xlabel('Date', fontsize=12, fontweight='bold')
         fig.suptitle(title, fontsize=16, fontweight='bold', y=0.995)
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save:
             filepath = os.path.join(self.output_dir, 'multi_indicator_dashboard.png')
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
+            self._write_png(fig, filepath)
             print(f"Saved: {filepath}")
-            plt.close()
             return filepath
         else:
             plt.show()
@@ -132,7 +390,7 @@ class EconomicCharts:
         Returns:
             Path to saved plot or None
         """
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._subplots((10, 8), save=save)
 
         im = ax.imshow(correlation_matrix, cmap='coolwarm', aspect='auto', vmin=-1, vmax=1)
 
@@ -145,54 +403,85 @@ class EconomicCharts:
         # Rotate labels
         plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
 
-        # Add correlation values
-        for i in range(len(correlation_matrix.index)):
-            for j in range(len(correlation_matrix.columns)):
-                text = ax.text(j, i, f'{correlation_matrix.iloc[i, j]:.2f}',
-                             ha="center", va="center", color="black", fontsize=10)
+        # Add correlation values, formatted in one pass; white text stays
+        # readable on the saturated cells at either end of the colormap
+        values = correlation_matrix.to_numpy()
+        labels = np.char.mod('%.2f', values)
+        text_colors = np.where(np.abs(values) > 0.8, 'white', 'black')
+        text_kwargs = dict(ha="center", va="center", fontsize=10)
+        for (i, j), label in np.ndenumerate(labels):
+            ax.text(j, i, label, color=text_colors[i, j], **text_kwargs)
 
         ax.set_title("Economic Indicator Correlations", fontsize=14, fontweight='bold', pad=20)
         fig.colorbar(im, ax=ax, label='Correlation Coefficient')
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save:
             filepath = os.path.join(self.output_dir, 'correlation_heatmap.png')
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
+            self._write_png(fig, filepath)
             print(f"Saved: {filepath}")
-            plt.close()
             return filepath
         else:
             plt.show()
             return None
 
-    def plot_interactive_dashboard(self, data_dict, save=True):
+    def plot_interactive_dashboard(self, data_dict, save=True, downsample=True):
         """
         Create an interactive Plotly dashboard
 
         Args:
             data_dict: Dictionary {indicator_name: df} with DataFrames
             save: Whether to save as HTML
+            downsample: Whether to thin very long series (LTTB) before plotting
 
         Returns:
             Path to saved HTML or None
         """
+        # Plotly takes a noticeable time to import and only this method uses
+        # it; after the first call the import is a sys.modules lookup
+        import plotly.graph_objects as go
+        from plotly.offline import get_plotlyjs_version
+        from plotly.subplots import make_subplots
+
         n_indicators = len(data_dict)
 
-        # Create subplots
-        fig = make_subplots(
-            rows=n_indicators, cols=1,
-            subplot_titles=list(data_dict.keys()),
-            vertical_spacing=0.08,
-            row_heights=[1]*n_indicators
-        )
+        # Building the subplot grid is the slow part of a Plotly figure, so
+        # the empty layout is made once per dashboard size and copied
+        template = self._plotly_templates.get(n_indicators)
+        if template is None:
+            template = make_subplots(
+                rows=n_indicators, cols=1,
+                subplot_titles=[' '] * n_indicators,
+                vertical_spacing=0.08,
+                row_heights=[1]*n_indicators
+            )
+            template.update_layout(
+                title_font_size=20,
+                height=300*n_indicators,
+                showlegend=True,
+                hovermode='x unified'
+            )
+            for idx in range(1, n_indicators + 1):
+                template.update_xaxes(title_text="Date", row=idx, col=1)
+                template.update_yaxes(title_text="Value", row=idx, col=1)
+            self._plotly_templates[n_indicators] = template
+
+        fig = go.Figure(template)
+        fig.update_layout(title_text="Economic Indicators Interactive Dashboard")
+        for annotation, indicator_name in zip(fig.layout.annotations, data_dict):
+            annotation.text = indicator_name
 
         colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E']
 
         for idx, (indicator_name, df) in enumerate(data_dict.items(), 1):
+            x, y = self._xy(df)
+            if downsample:
+                x, y = self._lttb(x, y, INTERACTIVE_MAX_POINTS)
+            scatter = go.Scattergl if len(y) > WEBGL_THRESHOLD else go.Scatter
             fig.add_trace(
-                go.Scatter(
-                    x=df['observation_date'],
-                    y=df['value'],
+                scatter(
+                    x=x,
+                    y=y,
                     mode='lines',
                     name=indicator_name,
                     line=dict(color=colors[(idx-1) % len(colors)], width=2),
@@ -201,23 +490,16 @@ class EconomicCharts:
                 row=idx, col=1
             )
 
-        # Update layout
-        fig.update_layout(
-            title_text="Economic Indicators Interactive Dashboard",
-            title_font_size=20,
-            height=300*n_indicators,
-            showlegend=True,
-            hovermode='x unified'
-        )
-
-        # Update axes
-        for idx in range(1, n_indicators + 1):
-            fig.update_xaxes(title_text="Date", row=idx, col=1)
-            fig.update_yaxes(title_text="Value", row=idx, col=1)
-
         if save:
             filepath = os.path.join(self.output_dir, 'interactive_dashboard.html')
-            fig.write_html(filepath)
+            data_file = 'interactive_dashboard.js'
+            # The page stays a small fixed shell; the trace data goes in the
+            # sidecar script and plotly.js comes from the CDN
+            with open(os.path.join(self.output_dir, data_file), 'w', encoding='utf-8') as f:
+                f.write(f"window.DASHBOARD_FIGURE = {fig.to_json(validate=False)};\n")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(_DASHBOARD_HTML.format(
+                    plotlyjs_version=get_plotlyjs_version(), data_file=data_file))
             print(f"Saved: {filepath}")
             return filepath
         else:
@@ -237,20 +519,23 @@ class EconomicCharts:
         Returns:
             Path to saved plot or None
         """
-        fig, ax = plt.subplots(figsize=(14, 6))
+        x, y = self._xy(historical_df, date_nums=True)
+        forecast_dates = self._date_nums(forecast_df['date'])
+        forecast, lower, upper = (
+            forecast_df[col].to_numpy(dtype=np.float64) for col in ('forecast', 'lower', 'upper')
+        )
+
+        fig, ax = self._subplots((14, 6), save=save)
 
         # Plot historical data
-        ax.plot(historical_df['observation_date'], historical_df['value'],
-               linewidth=2, color='#2E86AB', label='Historical')
+        ax.plot(x, y, linewidth=2, color='#2E86AB', label='Historical')
 
         # Plot forecast
-        ax.plot(forecast_df['date'], forecast_df['forecast'],
+        ax.plot(forecast_dates, forecast,
                linewidth=2, color='#F18F01', linestyle='--', label='Forecast')
 
         # Plot confidence interval
-        ax.fill_between(forecast_df['date'],
-                        forecast_df['lower'],
-                        forecast_df['upper'],
+        ax.fill_between(forecast_dates, lower, upper,
                         alpha=0.3, color='#F18F01', label='95% Confidence Interval')
 
         # Formatting
@@ -264,16 +549,15 @@ class EconomicCharts:
         # Format dates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-        plt.xticks(rotation=45, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save:
             filename = f"{indicator_name.lower().replace(' ', '_')}_forecast.png"
             filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
+            self._write_png(fig, filepath)
             print(f"Saved: {filepath}")
-            plt.close()
             return filepath
         else:
             plt.show()
@@ -291,13 +575,15 @@ class EconomicCharts:
         Returns:
             Path to saved plot or None
         """
-        fig, ax = plt.subplots(figsize=(12, 6))
+        x, y = self._xy(df, y_col='yoy_pct_change', date_nums=True)
+
+        fig, ax = self._subplots((12, 6), save=save)
 
         # Color bars based on positive/negative
-        colors = ['#6A994E' if x > 0 else '#C73E1D' for x in df['yoy_pct_change']]
+        colors = np.where(y > 0, '#6A994E', '#C73E1D')
 
-        ax.bar(df['observation_date'], df['yoy_pct_change'],
-              color=colors, alpha=0.7, width=20)
+        # With date numbers as x, the bar width is in days
+        ax.bar(x, y, color=colors, alpha=0.7, width=20)
 
         # Add zero line
         ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
@@ -312,16 +598,15 @@ class EconomicCharts:
         # Format dates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=6))
-        plt.xticks(rotation=45, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if save:
             filename = f"{indicator_name.lower().replace(' ', '_')}_yoy_change.png"
             filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
+            self._write_png(fig, filepath)
             print(f"Saved: {filepath}")
-            plt.close()
             return filepath
         else:
             plt.show()